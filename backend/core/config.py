@@ -60,6 +60,12 @@ class Settings:
     MAX_ARTICLES_PER_REQUEST: int = field(default_factory=lambda: int(os.getenv("MAX_ARTICLES_PER_REQUEST", "25")))
     DEFAULT_ARTICLE_COUNT: int = field(default_factory=lambda: int(os.getenv("DEFAULT_ARTICLE_COUNT", "5")))
     ARTICLE_CACHE_HOURS: int = field(default_factory=lambda: int(os.getenv("ARTICLE_CACHE_HOURS", "24")))
+    # Upper bound on NewsAPI requests in flight at once.  NewsAPI enforces a
+    # much stricter quota than the RSS hosts, so keep this small.
+    NEWSAPI_MAX_CONCURRENCY: int = field(default_factory=lambda: int(os.getenv("NEWSAPI_MAX_CONCURRENCY", "4")))
+    # Seconds NewsAPI is skipped after a 429 that carried no Retry-After
+    # header.  Afterwards it is tried again.
+    NEWSAPI_RATE_LIMIT_COOLDOWN: int = field(default_factory=lambda: int(os.getenv("NEWSAPI_RATE_LIMIT_COOLDOWN", "3600")))
 
     # CORS
     CORS_ORIGINS: List[str] = field(default_factory=lambda: [
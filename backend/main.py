@@ -16,6 +16,7 @@ import logging
 from .api.routes import router as api_router
 from .core.config import settings
 from .core.database import init_db
+from .services.news_aggregator import news_aggregator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,6 +29,7 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     logger.info("🛑 Shutting down the application...")
+    await news_aggregator.close()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -1,140 +1,1195 @@
+import asyncio
+import calendar
+import contextlib
+import hashlib
+import heapq
+import io
+import json
+import multiprocessing
+import os
 import random
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Callable, Iterable, List, Dict, Any, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+from xml.etree import ElementTree as ET
 import logging
 import aiohttp
 from ..core.config import settings
 import re
 
+# feedparser is optional; it handles malformed feeds that the streaming
+# RSS/Atom reader below rejects.  Without it those feeds are parsed by
+# the minimal ElementTree-based reader in ``NewsAggregator._fetch_rss_feed``.
+try:
+    import feedparser  # type: ignore
+except ImportError:
+    feedparser = None  # type: ignore
+
+# orjson decodes the (often large) NewsAPI responses several times faster
+# than the standard library; fall back to ``json`` when it is unavailable.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+# aiofiles lets the discovered-source cache be written without blocking the
+# event loop; a worker thread is used instead when it is not installed.
+try:
+    import aiofiles  # type: ignore
+except ImportError:
+    aiofiles = None  # type: ignore
+
+# RSS and Atom feeds are read with ``iterparse``.  lxml's libxml2 parser is
+# used when installed; the standard library offers the same API otherwise.
+try:
+    from lxml import etree as _etree  # type: ignore
+    _LXML = True
+except ImportError:
+    from xml.etree import ElementTree as _etree  # type: ignore
+    _LXML = False
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of RSS feeds downloaded and parsed at the same time.
+_RSS_MAX_CONCURRENCY = 8
+
+# Feeds with a larger body than this (bytes) are skipped rather than
+# buffered and shipped to a parser process; real news feeds are a few
+# hundred kilobytes at most.
+_RSS_MAX_BYTES = 2 * 1024 * 1024
+# Feed bodies are read in chunks of this size (bytes) so the limit above is
+# enforced while downloading.
+_RSS_READ_CHUNK = 64 * 1024
+
+# Parsed NewsAPI results for ``/v2/everything`` and ``/v2/top-headlines``
+# queries are reused for this many seconds, so dashboard refreshes and
+# repeated pagination do not hit the API again.  At most
+# ``_RESPONSE_CACHE_SIZE`` queries are kept (least recently used first out).
+_RESPONSE_CACHE_TTL = 5 * 60
+_RESPONSE_CACHE_SIZE = 512
+
+# A feed fetched within this many seconds is served from memory without
+# contacting the host at all; older entries are revalidated.
+_RSS_CACHE_TTL = 5 * 60
+
+# Headers sent with every feed request.  A browser‑like User‑Agent reduces
+# the chance of being blocked, and feeds are large, highly compressible XML
+# documents so compression is always requested.
+_RSS_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# At most this many requests are in flight to any single host, so a large
+# fan-out cannot trip an upstream's rate limiting on its own.  NewsAPI has a
+# stricter quota and uses ``settings.NEWSAPI_MAX_CONCURRENCY`` instead.
+_PER_HOST_CONCURRENCY = 8
+_NEWSAPI_HOST = "newsapi.org"
+
+# NewsAPI's ``/v2/everything`` accepts at most this many comma-separated
+# source IDs per request.
+_NEWSAPI_SOURCES_PER_REQUEST = 20
+
+# Transient failures (5xx responses, dropped connections and 429s that
+# carry a ``Retry-After`` header) are retried with exponential backoff and
+# jitter, up to this many attempts in total.  Server-requested waits longer
+# than ``_MAX_RETRY_AFTER`` seconds are not honoured; the failure is
+# returned to the caller instead.
+_MAX_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_AFTER = 30.0
+
+# feedparser is pure Python and holds the GIL while it parses, so feeds are
+# parsed in a pool of worker processes to spread the work across cores.
+# The pool is created on first use and shut down by ``NewsAggregator.close``.
+# A handful of workers is enough for the feeds fetched per request; more
+# would only add idle interpreter processes on large machines.
+_PARSE_POOL_MAX_WORKERS = 4
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+# The pool is created lazily, once aiohttp's resolver threads are already
+# running, and forking a multi-threaded process can leave locks held in the
+# child.  Workers are started from a clean process instead ("forkserver"
+# where the platform has it, "spawn" elsewhere).
+_PARSE_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(
+            max_workers=min(_PARSE_POOL_MAX_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(_PARSE_POOL_START_METHOD),
+        )
+    return _PARSE_POOL
+
+
+async def _run_in_parse_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run ``func(*args)`` in the parser process pool.
+
+    A pool whose worker died (e.g. killed by the OOM killer) is broken for
+    good: every later submission fails with ``BrokenProcessPool``.  The
+    broken pool is then discarded, so ``_get_parse_pool`` builds a fresh
+    one, and the call is retried once.
+
+    :param func: Picklable module-level function to run
+    :param args: Picklable arguments for ``func``
+    :return: The function's result
+    """
+    global _PARSE_POOL
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = _get_parse_pool()
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            # Concurrent callers may have replaced the pool already.
+            if _PARSE_POOL is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                _PARSE_POOL = None
+            if attempt:
+                raise
+            logger.warning("Feed parser pool is broken; starting a new one")
+
+
+def _parse_feed(content: bytes, cutoff: Optional[Tuple[int, ...]] = None) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    Parse a downloaded RSS/Atom document with feedparser inside a worker
+    process.
+
+    Only the fields the aggregator needs are returned, as plain dicts, which
+    keeps the result cheap to pickle back to the event loop process.
+
+    :param content: Raw feed document
+    :param cutoff: Optional ``(year, month, day, hour, minute, second)``
+                   tuple; dated entries published before it are dropped
+    :return: ``(error, entries)`` where ``error`` describes a malformed feed
+    """
+    feed = feedparser.parse(content)
+    if getattr(feed, "bozo", False):
+        return str(getattr(feed, "bozo_exception", "malformed feed")), []
+    entries: List[Dict[str, Any]] = []
+    for entry in feed.entries:
+        # feedparser normalizes dates to a UTC struct_time
+        parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+        # Compare the already parsed struct_time with the cutoff before
+        # building anything for the entry.  Feeds are usually newest first
+        # but not reliably so, hence skip rather than stop at the first
+        # stale entry.
+        if parsed and cutoff and tuple(parsed[:6]) < cutoff:
+            continue
+        description = entry.get("summary", "") or entry.get("description", "")
+        entries.append({
+            "title": entry.get("title", ""),
+            "description": description,
+            "summary": description,
+            "link": entry.get("link", "") or "",
+            "published_dt": datetime(*parsed[:6]) if parsed else None,
+            # struct_time is UTC, so timegm yields the epoch timestamp
+            # without going through a datetime.
+            "published_ts": calendar.timegm(parsed) if parsed else None,
+        })
+    return None, entries
+
+
+# Atom elements are namespaced; iterparse reports them as ``{ns}tag``.
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ATOM_ENTRY = _ATOM_NS + "entry"
+# Dublin Core ``<dc:date>`` (ISO 8601), used by feeds that omit ``pubDate``.
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+
+def _atom_link(entry: Any) -> str:
+    """Return the ``rel="alternate"`` link of an Atom entry (else the first one)."""
+    fallback = ""
+    for link in entry.iter(_ATOM_NS + "link"):
+        href = (link.get("href") or "").strip()
+        if not href:
+            continue
+        if link.get("rel", "alternate") == "alternate":
+            return href
+        fallback = fallback or href
+    return fallback
+
+
+def _release(elem: Any) -> None:
+    """
+    Free a consumed feed item.  Under lxml the emptied elements that came
+    before it are detached from the tree as well, so memory stays flat on
+    feeds with hundreds of items.
+    """
+    elem.clear()
+    if _LXML:
+        parent = elem.getparent()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _parse_rss_items(content: bytes, cutoff: Optional[Tuple[int, ...]] = None) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    Stream the ``<item>`` (RSS 2.0) or ``<entry>`` (Atom) elements of a feed
+    inside a worker process.
+
+    Only the handful of fields the aggregator uses are read, and each item
+    is cleared once consumed, so this is far cheaper than a full feedparser
+    pass.  Documents that are not well formed, contain neither items nor
+    entries, or carry a date this reader cannot parse are reported as
+    errors so the caller can fall back to feedparser.  Items without any
+    date are dropped.
+
+    :param content: Raw feed document
+    :param cutoff: Optional ``(year, month, day, hour, minute, second)``
+                   tuple; dated items published before it are dropped
+    :return: ``(error, entries)`` with the same entry dicts as ``_parse_feed``
+    """
+    cutoff_dt = datetime(*cutoff) if cutoff else None
+    entries: List[Dict[str, Any]] = []
+    found_items = False
+    # lxml can hand back only the item/entry elements, skipping a Python
+    # round trip for every other element in the document.
+    tag_filter = {"tag": ("item", _ATOM_ENTRY)} if _LXML else {}
+    try:
+        for _, elem in _etree.iterparse(io.BytesIO(content), events=("end",), **tag_filter):
+            if elem.tag == "item":
+                title = elem.findtext("title")
+                description = elem.findtext("description")
+                link = (elem.findtext("link") or "").strip()
+                pub_str = elem.findtext("pubDate")
+                parse_date = parsedate_to_datetime
+                if not pub_str:
+                    pub_str = elem.findtext(_DC_DATE)
+                    parse_date = datetime.fromisoformat
+            elif elem.tag == _ATOM_ENTRY:
+                title = elem.findtext(_ATOM_NS + "title")
+                description = elem.findtext(_ATOM_NS + "summary") or elem.findtext(_ATOM_NS + "content")
+                link = _atom_link(elem)
+                pub_str = elem.findtext(_ATOM_NS + "published") or elem.findtext(_ATOM_NS + "updated") or elem.findtext(_DC_DATE)
+                parse_date = datetime.fromisoformat
+            else:
+                continue
+            found_items = True
+            # Undated items cannot be placed in the feed's timeline; drop
+            # them rather than pass them off as current.
+            if not pub_str or not pub_str.strip():
+                _release(elem)
+                continue
+            try:
+                published_dt = parse_date(pub_str.strip())
+            except (TypeError, ValueError):
+                # feedparser understands far more date formats
+                return f"unrecognized date {pub_str.strip()!r}", []
+            # Normalize to naive UTC like feedparser's struct_time
+            if published_dt.tzinfo is not None:
+                published_dt = published_dt.astimezone(timezone.utc).replace(tzinfo=None)
+            if cutoff_dt is not None and published_dt < cutoff_dt:
+                _release(elem)
+                continue
+            description = (description or "").strip()
+            entries.append({
+                "title": (title or "").strip(),
+                "description": description,
+                "summary": description,
+                "link": link,
+                "published_dt": published_dt,
+                "published_ts": _utc_timestamp(published_dt),
+            })
+            _release(elem)
+    except SyntaxError as e:
+        # Both ElementTree.ParseError and lxml's XMLSyntaxError derive
+        # from SyntaxError
+        return str(e), []
+    if not found_items:
+        return "no feed items found", []
+    return None, entries
+
+
+# Keyword heuristics used by ``NewsAggregator._get_topic_category`` to map a
+# free‑form topic onto one of the seven canonical NewsAPI categories.  The
+# order of the categories matters: when a topic matches several of them the
+# first one listed here is used.
+_TOPIC_CATEGORIES: Dict[str, List[str]] = {
+    "business": [
+        "business", "finance", "economy", "economic", "stock", "stocks", "markets", "company", "companies"
+    ],
+    "entertainment": [
+        "entertainment", "movie", "movies", "film", "cinema", "hollywood", "music", "celebrity", "celebrities"
+    ],
+    "general": [
+        "general", "news", "top stories", "headlines", "current events"
+    ],
+    "health": [
+        "health", "healthcare", "medicine", "medical", "wellness", "fitness", "covid", "pandemic"
+    ],
+    "science": [
+        "science", "research", "physics", "chemistry", "biology", "space", "astronomy", "quantum"
+    ],
+    "sports": [
+        "sports", "sport", "football", "soccer", "basketball", "baseball", "tennis", "golf", "olympics"
+    ],
+    "technology": [
+        "technology", "tech", "gadget", "gadgets", "ai", "artificial intelligence", "machine learning", "computing", "software"
+    ],
+}
+_CATEGORY_ORDER: Dict[str, int] = {category: i for i, category in enumerate(_TOPIC_CATEGORIES)}
+_KEYWORD_CATEGORY: Dict[str, str] = {
+    keyword: category
+    for category, keywords in reversed(_TOPIC_CATEGORIES.items())
+    for keyword in keywords
+}
+# Single-word keywords are found by looking each word of the topic up in
+# ``_KEYWORD_CATEGORY``; only the few multi‑word phrases need a regex.  None
+# of the phrases contains a single-word keyword, so the two never overlap.
+_TOPIC_WORD_RE = re.compile(r"\w+")
+_TOPIC_PHRASE_RE = re.compile(
+    r"\b(" + "|".join(
+        re.escape(k) for k in sorted((k for k in _KEYWORD_CATEGORY if " " in k), key=len, reverse=True)
+    ) + r")\b"
+)
+
+
+@lru_cache(maxsize=512)
+def _topic_category(topic_lower: str) -> str:
+    """
+    Resolve a normalized topic to its NewsAPI category (see
+    ``NewsAggregator._get_topic_category``).  Users keep asking for the
+    same handful of topics, so results are memoized.
+    """
+    # Most topics are a single known keyword ("sports", "ai"): one dict
+    # lookup settles those without scanning.
+    category = _KEYWORD_CATEGORY.get(topic_lower)
+    if category is not None:
+        return category
+    # Otherwise collect every keyword in the topic: a set lookup per word,
+    # plus a phrase scan for multi‑word topics.  The earliest category (in
+    # definition order) wins.
+    words = _TOPIC_WORD_RE.findall(topic_lower)
+    matched = [word for word in words if word in _KEYWORD_CATEGORY]
+    if len(words) > 1:
+        matched.extend(_TOPIC_PHRASE_RE.findall(topic_lower))
+    if matched:
+        return min(
+            (_KEYWORD_CATEGORY[keyword] for keyword in matched),
+            key=_CATEGORY_ORDER.__getitem__,
+        )
+    return topic_lower
+
+
+@lru_cache(maxsize=256)
+def _topic_pattern(keywords: frozenset) -> "re.Pattern[str]":
+    """
+    Compile a case-insensitive pattern matching any of ``keywords``.
+
+    Cached per keyword set so repeated requests for the same topics reuse
+    the compiled pattern.  Longer keywords come first so a phrase is never
+    shadowed by one of its own words.
+    """
+    ordered = sorted(keywords, key=lambda kw: (-len(kw), kw))
+    return re.compile("|".join(re.escape(kw) for kw in ordered), re.IGNORECASE)
+
+
+# On-disk cache of NewsAPI source IDs discovered at runtime.
+_SOURCE_MAP_CACHE_PATH = os.path.join(os.path.dirname(__file__), "newsapi_source_map.json")
+
+# How long the NewsAPI ``/v2/sources`` catalogue is reused before it is
+# downloaded again (seconds).
+_SOURCES_CACHE_TTL = 6 * 60 * 60
+
+# Query parameters that only track where a click came from.  They are
+# ignored when deciding whether two article URLs point at the same story.
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "ocid", "cmpid", "ref"})
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize an article URL into a key for duplicate detection.
+
+    The scheme, a leading ``www.``, a trailing slash, the fragment and
+    tracking parameters are dropped and the host is lower‑cased, so the
+    same story syndicated with different click tracking collapses to a
+    single key.  The original URL is still what gets returned to callers.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = "&".join(
+        pair
+        for pair in parts.query.split("&")
+        if pair
+        and not pair.startswith(_TRACKING_PARAM_PREFIXES)
+        and pair.split("=", 1)[0] not in _TRACKING_PARAMS
+    )
+    key = host + parts.path.rstrip("/")
+    return f"{key}?{query}" if query else key
+
+
+@dataclass(slots=True)
+class Article:
+    """
+    A single fetched article.
+
+    The fetchers build these slotted records instead of one dict per
+    article, which keeps the per-article footprint small while many feeds
+    and NewsAPI pages are merged.  ``fetch_articles`` converts them to
+    plain dicts only for the articles it actually returns.
+
+    ``published_ts`` is the publication time as a UTC epoch timestamp,
+    computed once when the article is built and used for ranking; it is
+    not part of the dict returned to callers.
+    """
+    title: str
+    content: str
+    url: str
+    source: str
+    published_at: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    published_ts: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the dict form handed to API callers.  The metadata is copied
+        because the routes annotate it in place.
+        """
+        return {
+            "title": self.title,
+            "content": self.content,
+            "url": self.url,
+            "source": self.source,
+            "published_at": self.published_at,
+            "metadata": dict(self.metadata),
+        }
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+@dataclass(slots=True)
+class _CachedFeed:
+    """Last parsed result of a feed, kept by ``NewsAggregator._fetch_rss_feed``."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: bytes
+    entries: List[Dict[str, Any]]
+    fetched_at: float
+
+
+@dataclass(slots=True)
+class _SourceCatalogue:
+    """
+    NewsAPI ``/v2/sources`` listing indexed for name lookups, kept by
+    ``NewsAggregator._get_newsapi_sources``.
+    """
+    by_name: Dict[str, str]
+    # Lower-cased names in catalogue order, and word -> positions in
+    # ``names`` of the names containing it (ascending).
+    names: List[str]
+    by_token: Dict[str, List[int]]
+    fetched_at: float
+
+    @classmethod
+    def from_sources(cls, sources: Iterable[Dict[str, Any]]) -> "_SourceCatalogue":
+        by_name: Dict[str, str] = {
+            src.get("name", "").lower(): src["id"]
+            for src in sources
+            if src.get("id")
+        }
+        names = list(by_name)
+        by_token: Dict[str, List[int]] = {}
+        for position, name in enumerate(names):
+            for token in set(name.split()):
+                by_token.setdefault(token, []).append(position)
+        return cls(by_name, names, by_token, time.monotonic())
+
+    def match(self, source_name: str) -> Optional[str]:
+        """
+        Look a human-readable source name up, first by exact
+        (case-insensitive) name and then by searching for the first source
+        (in catalogue order) whose name contains it.
+
+        The token index finds the first name containing the search term
+        that also shares its first word.  Only the names before that one
+        still need a substring scan, so the result is the same as a scan
+        of the whole catalogue.
+
+        :param source_name: Human‑readable news outlet name (e.g. "BBC News")
+        :return: The matching source ID, or ``None``
+        """
+        # Normalize the search term for comparison
+        search_term = source_name.lower()
+        source_id = self.by_name.get(search_term)
+        if source_id:
+            return source_id
+        words = search_term.split()
+        if not words:
+            return None
+        bound = len(self.names)
+        for position in self.by_token.get(words[0], ()):
+            if search_term in self.names[position]:
+                bound = position
+                break
+        for name in self.names[:bound]:
+            if search_term in name:
+                return self.by_name[name]
+        if bound < len(self.names):
+            return self.by_name[self.names[bound]]
+        return None
+
+
+def _gunzip(content: bytes) -> Optional[bytes]:
+    """
+    Inflate a gzip body, stopping once it exceeds ``_RSS_MAX_BYTES``.
+
+    A small compressed body can expand to gigabytes, so the output is
+    bounded rather than inflated in one go.
+
+    :param content: gzip-compressed bytes
+    :return: The inflated bytes, or ``None`` if they exceed the limit
+    """
+    # 16 + MAX_WBITS makes zlib expect a gzip header and trailer
+    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    inflated = inflater.decompress(content, _RSS_MAX_BYTES + 1)
+    if len(inflated) > _RSS_MAX_BYTES:
+        return None
+    return inflated
+
+
+# Only this much of an error response body is read for logging.
+_ERROR_BODY_LIMIT = 256
+
+
+async def _error_body(resp: aiohttp.ClientResponse) -> str:
+    """
+    Return the start of an error response body for logging.
+
+    Only ``_ERROR_BODY_LIMIT`` bytes are read, so a burst of rate-limit or
+    server errors does not pull whole error pages over the wire, and
+    nothing is read when warnings are not logged.
+    """
+    if not logger.isEnabledFor(logging.WARNING):
+        return ""
+    try:
+        return (await resp.content.read(_ERROR_BODY_LIMIT)).decode("utf-8", errors="replace")
+    except Exception:
+        return ""
+
+
+def _utc_timestamp(dt: datetime) -> float:
+    """Return the epoch timestamp of ``dt``, treating naive values as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Convert a ``Retry-After`` header (seconds or an HTTP date) into a
+    number of seconds from now, or ``None`` if it is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, delay)
+
+
+def _retry_delay(resp: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+    """
+    Return how long to wait before retrying a failed response, or ``None``
+    if it should not be retried.
+
+    A ``Retry-After`` header (in seconds or as an HTTP date) takes
+    precedence.  A 429 without one is not retried: for NewsAPI it means the
+    key's quota is spent and the caller should move on to the next key.
+
+    :param resp: Response with a status in ``_RETRY_STATUSES``
+    :param attempt: Number of attempts made so far (starting at 1)
+    """
+    delay = _parse_retry_after(resp.headers.get("Retry-After"))
+    if delay is not None:
+        return delay if delay <= _MAX_RETRY_AFTER else None
+    if resp.status == 429:
+        return None
+    return 2 ** (attempt - 1) + random.random()
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _title_key(title: str) -> str:
+    """
+    Normalize a headline for duplicate detection: runs of whitespace
+    (including the newlines and non‑breaking spaces feeds like to embed)
+    collapse to one space and case is ignored.
+    """
+    return _WHITESPACE_RE.sub(" ", title).strip().lower()
+
+
+def _dedup(articles: Iterable[Article], by_title: bool = False) -> List[Article]:
+    """
+    Drop articles without a URL and repeats of a story already seen, in a
+    single pass that keeps the first occurrence.
+
+    Stories are matched on their canonical URL and, with ``by_title``, also
+    on their normalized headline.
+    """
+    unique: List[Article] = []
+    seen_urls = set()
+    seen_titles = set()
+    for article in articles:
+        if not article.url:
+            continue
+        url_key = _canonical_url(article.url)
+        if url_key in seen_urls:
+            continue
+        title = _title_key(article.title or "") if by_title else ""
+        if title and title in seen_titles:
+            continue
+        seen_urls.add(url_key)
+        if title:
+            seen_titles.add(title)
+        unique.append(article)
+    return unique
+
+
+def _newest(articles: List[Article], limit: int) -> List[Article]:
+    """
+    Return the ``limit`` most recently published articles, newest first.
+
+    Only the top ``limit`` items are ordered (a bounded heap) instead of
+    sorting the whole candidate list and slicing it afterwards.  Articles
+    are compared on their numeric timestamp: ISO strings from NewsAPI
+    (``...Z``) and RSS (no offset) do not sort correctly against each other.
+    """
+    return heapq.nlargest(limit, articles, key=attrgetter("published_ts"))
+
+
+def _request_key(endpoint: str, params: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """
+    Build the response cache key for a NewsAPI request from the endpoint
+    and the query parameters actually sent (the API key excluded).
+    """
+    return (endpoint,) + tuple(sorted((k, v) for k, v in params.items() if k != "apiKey"))
+
+
+def _newsapi_articles(
+    data: Dict[str, Any],
+    now: datetime,
+    cutoff_ts: float,
+    source_names: Optional[Mapping[str, str]] = None,
+) -> List[Article]:
+    """
+    Convert the ``articles`` of a NewsAPI response into ``Article`` records,
+    skipping anything published before ``cutoff_ts``.
+
+    :param data: Decoded NewsAPI response body
+    :param now: Fallback publication time for items without ``publishedAt``
+    :param cutoff_ts: Oldest accepted publication time (POSIX timestamp)
+    :param source_names: Optional ``{source id: name}`` overriding the
+                         source name NewsAPI reports
+    :return: List of articles in response order
+    """
+    # Narrow queries often match nothing; skip the conversion entirely.
+    if data.get("totalResults") == 0:
+        return []
+    now_iso = now.isoformat()
+    articles: List[Article] = []
+    for item in data.get("articles", []):
+        published_at = item.get("publishedAt") or now_iso
+        try:
+            published_dt = datetime.fromisoformat(published_at)
+        except Exception:
+            published_dt = now
+        published_ts = _utc_timestamp(published_dt)
+        if published_ts < cutoff_ts:
+            continue
+        item_source = item.get("source") or {}
+        source_name = item_source.get("name")
+        source = source_names.get(item_source.get("id")) if source_names else None
+        articles.append(Article(
+            title=item.get("title", ""),
+            content=item.get("description") or item.get("content") or "",
+            url=item.get("url", ""),
+            source=source or source_name or "",
+            published_at=published_at,
+            published_ts=published_ts,
+            metadata={
+                "author": item.get("author"),
+                "source_name": source_name,
+            },
+        ))
+    return articles
+
+
+# The source maps below are module-level, read-only constants so they are
+# built once per process rather than for every ``NewsAggregator``.
+
+# Map human-readable source names (as returned by the LLM) to
+# NewsAPI source identifiers.  Only sources present in this
+# mapping will be used for real article fetching.  You can extend
+# this mapping with additional providers supported by your news
+# service.  See https://newsapi.org/sources for a list of IDs.
+_NEWSAPI_SOURCE_MAP: Mapping[str, str] = MappingProxyType({
+    "Reuters": "reuters",
+    "Associated Press": "associated-press",
+    "BBC News": "bbc-news",
+    "NPR": "npr",
+    "The Guardian": "the-guardian-uk",
+    # Add other known sources here as needed
+})
+
+
+# RSS feed URLs for each source.  These feeds can be used to fetch
+# headlines without requiring an API key.  Not all outlets provide
+# straightforward RSS feeds; some may require scraping or are omitted.
+#
+# This mapping has been extended to include several entertainment
+# outlets commonly suggested by the language model.  Where possible
+# official feeds were used; however, some sites do not expose
+# first‑party RSS feeds.  For those, the entry is left absent and the
+# outlet will simply be skipped during RSS fetching.
+_RSS_FEED_MAP: Mapping[str, str] = MappingProxyType({
+    # Use HTTPS for Reuters to avoid connection errors in environments
+    # that disallow plain HTTP connections
+    "Reuters": "https://news.google.com/rss/search?q=site:reuters.com&hl=en-US&gl=US&ceid=US:en",
+    "BBC News": "http://feeds.bbci.co.uk/news/rss.xml",
+    "NPR": "https://feeds.npr.org/1001/rss.xml",
+    "The Guardian": "https://www.theguardian.com/world/rss",
+    # Entertainment outlets
+    "The Hollywood Reporter": "https://www.hollywoodreporter.com/feed",
+    "Variety": "https://variety.com/feed",
+    "Los Angeles Times": "https://www.latimes.com/world-nation/rss2.0.xml",
+    "Rolling Stone": "https://www.rollingstone.com/feed",
+    "Deadline Hollywood": "https://deadline.com/feed",
+    "IndieWire": "https://www.indiewire.com/feed",
+    "Screen International": "https://screendaily.com/45202.rss",
+
+    # Additional entertainment and general outlets
+    "E! News": "https://www.eonline.com/syndication/feeds/rssfeeds/topstories.xml",
+
+    # Business outlets
+    "CNBC": "https://www.cnbc.com/id/100003114/device/rss/rss.html",
+    "BBC Business": "https://feeds.bbci.co.uk/news/business/rss.xml",
+    "Forbes": "https://www.forbes.com/business/feed",
+    "Financial Times": "https://www.ft.com/?edition=international&format=rss",
+
+    # General news outlets
+    "CNN": "http://rss.cnn.com/rss/edition.rss",
+    "Al Jazeera English": "https://www.aljazeera.com/xml/rss/all.xml",
+    "The New York Times": "https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml",
+    "The Washington Post": "http://feeds.washingtonpost.com/rss/world",
+
+    # Sports outlets
+    "ESPN": "https://www.espn.com/espn/rss/news",
+    "Sky Sports": "https://www.skysports.com/rss/12040",
+    "CBS Sports": "https://www.cbssports.com/rss/headlines/",
+    "BBC Sport": "http://feeds.bbci.co.uk/sport/rss.xml",
+
+    # Health outlets
+
+    # Technology and science outlets
+    # These feeds were sourced from publicly available RSS listings.
+    # The Verge: general technology and culture feed
+    "The Verge": "https://www.theverge.com/rss/index.xml",
+    # MIT Technology Review: top news feed
+    "MIT Technology Review": "https://www.technologyreview.com/topnews.rss",
+    # Wired: main RSS feed
+    "Wired": "https://www.wired.com/feed/rss",
+    # New Scientist: home page feed
+    "New Scientist": "https://www.newscientist.com/feed/home",
+    # IEEE Spectrum: full‑text feed
+    "IEEE Spectrum": "https://spectrum.ieee.org/rss/fulltext",
+    # Nature: research and news feed (science)
+    "Nature": "http://feeds.nature.com/nature/rss/current",
+    # Science Magazine: news from science
+    "Science Magazine": "https://www.sciencemag.org/rss/news_current.xml",
+})
+
+
+def _collect_newsapi_keys() -> Tuple[str, ...]:
+    """
+    Collect all available NewsAPI keys for quota rotation.
+
+    Keys are pulled from multiple settings and environment variables to be
+    robust to different deployment naming conventions (e.g. NEWS_API_KEY vs
+    NEWS_API).  The primary key is always considered first.  Keys ending in
+    _1, or _2 allow simple rotation when the free quota is exhausted.
+    """
+    keys: List[str] = []
+    # Pull keys from the Settings dataclass when defined
+    if settings.NEWS_API_KEY:
+        keys.append(settings.NEWS_API_KEY)
+    for i in range(1, 3):
+        key_val = getattr(settings, f"NEWS_API_KEY_{i}", None)
+        if key_val:
+            keys.append(key_val)
+    # Fallback: also check for alternative environment variable names
+    # like NEWS_API, NEWS_API_1, NEWS_API_2. Some
+    # deployments may define API keys using these names.  We use
+    # os.getenv directly here to avoid adding more fields to settings.
+    for fallback_name in ["NEWS_API", "NEWS_API_1", "NEWS_API_2"]:
+        val = os.getenv(fallback_name)
+        if val and val not in keys:
+            keys.append(val)
+    return tuple(keys)
+
+
+# Settings are read once at import, so the keys are collected once too.
+_NEWSAPI_KEYS = _collect_newsapi_keys()
+
+
 class NewsAggregator:
     """
-    Mock news aggregator that simulates fetching articles from various sources.
-    In a real implementation, this would integrate with actual news APIs.
+    News aggregator that fetches articles from NewsAPI, topped up from RSS
+    feeds, over a single shared HTTP session.
     """
     
     def __init__(self):
-        # Map human-readable source names (as returned by the LLM) to
-        # NewsAPI source identifiers.  Only sources present in this
-        # mapping will be used for real article fetching.  You can extend
-        # this mapping with additional providers supported by your news
-        # service.  See https://newsapi.org/sources for a list of IDs.
-        self.newsapi_source_map = {
-            "Reuters": "reuters",
-            "Associated Press": "associated-press",
-            "BBC News": "bbc-news",
-            "NPR": "npr",
-            "The Guardian": "the-guardian-uk",
-            # Add other known sources here as needed
-        }
+        # NewsAPI source identifiers by source name.  This copy of the
+        # built-in ``_NEWSAPI_SOURCE_MAP`` is mutable because identifiers
+        # discovered at runtime are added to it.
+        self.newsapi_source_map: Dict[str, str] = dict(_NEWSAPI_SOURCE_MAP)
 
-        # RSS feed URLs for each source.  These feeds can be used to fetch
-        # headlines without requiring an API key.  Not all outlets provide
-        # straightforward RSS feeds; some may require scraping or are omitted.
-        #
-        # This mapping has been extended to include several entertainment
-        # outlets commonly suggested by the language model.  Where possible
-        # official feeds were used; however, some sites do not expose
-        # first‑party RSS feeds.  For those, the entry is left absent and the
-        # outlet will simply be skipped during RSS fetching.
-        self.rss_feed_map = {
-            # Use HTTPS for Reuters to avoid connection errors in environments
-            # that disallow plain HTTP connections
-            "Reuters": "https://news.google.com/rss/search?q=site:reuters.com&hl=en-US&gl=US&ceid=US:en",
-            "BBC News": "http://feeds.bbci.co.uk/news/rss.xml",
-            "NPR": "https://feeds.npr.org/1001/rss.xml",
-            "The Guardian": "https://www.theguardian.com/world/rss",
-            # Entertainment outlets
-            "The Hollywood Reporter": "https://www.hollywoodreporter.com/feed",
-            "Variety": "https://variety.com/feed",
-            "Los Angeles Times": "https://www.latimes.com/world-nation/rss2.0.xml",
-            "Rolling Stone": "https://www.rollingstone.com/feed",
-            "Deadline Hollywood": "https://deadline.com/feed",
-            "IndieWire": "https://www.indiewire.com/feed",
-            "Screen International": "https://screendaily.com/45202.rss",
-
-            # Additional entertainment and general outlets
-            "E! News": "https://www.eonline.com/syndication/feeds/rssfeeds/topstories.xml",
-
-            # Business outlets
-            "CNBC": "https://www.cnbc.com/id/100003114/device/rss/rss.html",
-            "BBC Business": "https://feeds.bbci.co.uk/news/business/rss.xml",
-            "Forbes": "https://www.forbes.com/business/feed",
-            "Financial Times": "https://www.ft.com/?edition=international&format=rss",
-
-            # General news outlets
-            "CNN": "http://rss.cnn.com/rss/edition.rss",
-            "Al Jazeera English": "https://www.aljazeera.com/xml/rss/all.xml",
-            "The New York Times": "https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml",
-            "The Washington Post": "http://feeds.washingtonpost.com/rss/world",
-
-            # Sports outlets
-            "ESPN": "https://www.espn.com/espn/rss/news",
-            "Sky Sports": "https://www.skysports.com/rss/12040",
-            "CBS Sports": "https://www.cbssports.com/rss/headlines/",
-            "BBC Sport": "http://feeds.bbci.co.uk/sport/rss.xml",
-
-            # Health outlets
-
-            # Technology and science outlets
-            # These feeds were sourced from publicly available RSS listings.
-            # The Verge: general technology and culture feed
-            "The Verge": "https://www.theverge.com/rss/index.xml",
-            # MIT Technology Review: top news feed
-            "MIT Technology Review": "https://www.technologyreview.com/topnews.rss",
-            # Wired: main RSS feed
-            "Wired": "https://www.wired.com/feed/rss",
-            # New Scientist: home page feed
-            "New Scientist": "https://www.newscientist.com/feed/home",
-            # IEEE Spectrum: full‑text feed
-            "IEEE Spectrum": "https://spectrum.ieee.org/rss/fulltext",
-            # Nature: research and news feed (science)
-            "Nature": "http://feeds.nature.com/nature/rss/current",
-            # Science Magazine: news from science
-            "Science Magazine": "https://www.sciencemag.org/rss/news_current.xml",
-        }
+        # Source IDs discovered through ``discover_api_for_source`` in earlier
+        # runs are cached on disk.  Load them once here; new discoveries are
+        # written back in the background by ``_schedule_source_flush``.
+        self._discovered_sources: Dict[str, str] = self._load_discovered_sources()
+        # Built-in identifiers take precedence over cached discoveries.
+        for name, source_id in self._discovered_sources.items():
+            self.newsapi_source_map.setdefault(name, source_id)
+        self._source_map_dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # RSS feed URLs for each source (read-only, shared by all
+        # instances; see ``_RSS_FEED_MAP``).
+        self.rss_feed_map: Mapping[str, str] = _RSS_FEED_MAP
+
+        # Monotonic time until which NewsAPI is considered rate limited (see
+        # ``newsapi_rate_limited``).  Set by ``_mark_rate_limited`` after a
+        # 429 that retries could not get past.
+        self._rate_limited_until: float = 0.0
+
+        # NewsAPI keys for quota rotation, primary key first (see
+        # ``_collect_newsapi_keys``).
+        self.newsapi_keys: List[str] = list(_NEWSAPI_KEYS)
+
+        # Shared HTTP session used for every NewsAPI and RSS request.  It is
+        # created lazily on first use (a session must be bound to a running
+        # event loop) and closed from the application lifespan hook.
+        self.session: Optional[aiohttp.ClientSession] = None
+        # One semaphore per host, created on first use by ``_request``.
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
 
-        # Track whether the NewsAPI has responded with a rate‑limit error.
-        # When this flag is true, subsequent requests to the NewsAPI will be
-        # skipped for the remainder of the process to avoid repeated 429
-        # responses.  The flag resets when the application restarts.
-        self.newsapi_rate_limited: bool = False
-
-        # Collect all available NewsAPI keys for quota rotation.  Attempt
-        # to pull from multiple environment variables to be robust to
-        # different deployment naming conventions (e.g. NEWS_API_KEY vs
-        # NEWS_API).  The primary key is always considered first.  Keys
-        # ending in _1, or _2 allow simple rotation when the free
-        # quota is exhausted.
-        self.newsapi_keys: List[str] = []
-        # Pull keys from the Settings dataclass when defined
-        if settings.NEWS_API_KEY:
-            self.newsapi_keys.append(settings.NEWS_API_KEY)
-        for i in range(1, 3):
-            key_attr = f"NEWS_API_KEY_{i}"
+        # Cached NewsAPI source catalogue, filled by ``_get_newsapi_sources``.
+        self._sources_cache: Optional[_SourceCatalogue] = None
+        self._sources_lock = asyncio.Lock()
+        # Last parsed result per feed URL.  Fresh entries (see
+        # ``_RSS_CACHE_TTL``) are reused outright; otherwise the validators
+        # are sent back so unchanged feeds answer 304, and the body digest
+        # lets an identical document skip parsing when the server ignores
+        # them.
+        self._feed_cache: Dict[str, _CachedFeed] = {}
+        # Recent NewsAPI results as ``{query key: (expires_at, articles)}``,
+        # see ``_cached_response``.
+        self._response_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, List[Article]]]" = OrderedDict()
+        # NewsAPI requests currently in flight, by response cache key (see
+        # ``_cached_fetch``).
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[List[Article]]"] = {}
+
+    def _cached_response(self, key: Tuple[Any, ...]) -> Optional[List[Article]]:
+        """Return a still fresh cached NewsAPI result for ``key``, if any."""
+        cached = self._response_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, articles = cached
+        if time.monotonic() >= expires_at:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return list(articles)
+
+    def _store_response(self, key: Tuple[Any, ...], articles: List[Article]) -> None:
+        """Cache a successful NewsAPI result for ``_RESPONSE_CACHE_TTL`` seconds."""
+        self._response_cache[key] = (time.monotonic() + _RESPONSE_CACHE_TTL, list(articles))
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    async def _cached_fetch(
+        self,
+        key: Tuple[Any, ...],
+        fetch: Callable[[], Awaitable[Optional[List[Article]]]],
+    ) -> List[Article]:
+        """
+        Return the NewsAPI result for ``key`` from the response cache, or
+        run ``fetch`` to produce it.
+
+        Concurrent callers asking for the same key while it is being
+        fetched wait for that one request instead of each sending their
+        own.  ``fetch`` returns ``None`` on failure; failures are not
+        cached and yield an empty list.  Empty results are cached like any
+        other, so a query matching nothing is not repeated within
+        ``_RESPONSE_CACHE_TTL``.
+
+        :param key: Response cache key identifying the query
+        :param fetch: Coroutine function performing the request
+        :return: List of articles
+        """
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(key)
+        if task is None:
+            async def run() -> List[Article]:
+                articles = await fetch()
+                if articles is None:
+                    return []
+                self._store_response(key, articles)
+                return articles
+
+            task = self._inflight[key] = asyncio.ensure_future(run())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller going away does not cancel the request
+        # for the others.
+        return list(await asyncio.shield(task))
+
+    @property
+    def newsapi_rate_limited(self) -> bool:
+        """
+        Whether NewsAPI requests should currently be skipped.  The flag
+        clears itself once the rate‑limit window has passed, so NewsAPI is
+        used again without restarting the application.
+        """
+        return time.monotonic() < self._rate_limited_until
+
+    def _mark_rate_limited(self, retry_after: Optional[str] = None) -> None:
+        """
+        Skip NewsAPI until the rate‑limit window expires.
+
+        :param retry_after: ``Retry-After`` header of the 429 response, if
+                            any; otherwise ``settings.NEWSAPI_RATE_LIMIT_COOLDOWN``
+                            seconds are used
+        """
+        window = _parse_retry_after(retry_after)
+        if window is None:
+            window = settings.NEWSAPI_RATE_LIMIT_COOLDOWN
+        self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + window)
+        logger.warning(f"NewsAPI rate limited; skipping it for {window:.0f}s")
+
+    @staticmethod
+    def _load_discovered_sources() -> Dict[str, str]:
+        """Read the on-disk cache of discovered NewsAPI source IDs."""
+        try:
+            with open(_SOURCE_MAP_CACHE_PATH, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable NewsAPI source cache: {e}")
+            return {}
+        return cached if isinstance(cached, dict) else {}
+
+    async def _save_discovered_sources(self) -> None:
+        """
+        Write the discovered NewsAPI source IDs to disk without blocking the
+        event loop.
+
+        The mapping is serialized up front so the written snapshot is
+        consistent, then written to a temporary file which atomically
+        replaces the cache, so a crash mid-write can never leave a
+        truncated file.
+        """
+        payload = json.dumps(self._discovered_sources, indent=2)
+        tmp_path = f"{_SOURCE_MAP_CACHE_PATH}.tmp"
+        if aiofiles is not None:
+            async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+                await f.write(payload)
+        else:
+            def write() -> None:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+            await asyncio.to_thread(write)
+        os.replace(tmp_path, _SOURCE_MAP_CACHE_PATH)
+
+    def _schedule_source_flush(self) -> None:
+        """
+        Persist newly discovered source IDs without making the request wait.
+
+        Only one flush task runs at a time, so writes never interleave;
+        discoveries made while it is writing mark the map dirty again and are
+        picked up by the same task.
+        """
+        self._source_map_dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_discovered_sources())
+
+    async def _flush_discovered_sources(self) -> None:
+        while self._source_map_dirty:
+            self._source_map_dirty = False
+            try:
+                await self._save_discovered_sources()
+            except Exception as e:
+                logger.warning(f"Failed to persist discovered API mappings: {e}")
+                return
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared ``aiohttp`` session, creating it if necessary.
+
+        The connector caps the number of open sockets (overall and per
+        host) and caches DNS lookups so repeated requests to
+        ``newsapi.org`` and the RSS hosts reuse resolved addresses and
+        keep-alive connections instead of paying for a fresh TCP/TLS
+        handshake on every call.  A default timeout keeps a single slow
+        host from stalling a request indefinitely.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self.session
+
+    async def close(self):
+        """Close the shared HTTP session and feed parser pool (called on application shutdown)."""
+        global _PARSE_POOL
+        # Let a pending source-map write finish before shutting down
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        if self.session and not self.session.closed:
+            await self.session.close()
+        if _PARSE_POOL is not None:
+            _PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+            _PARSE_POOL = None
+
+    @contextlib.asynccontextmanager
+    async def _request(self, url: str, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Issue a GET over the shared session and yield the final response.
+
+        Requests to the same host share a semaphore of
+        ``_PER_HOST_CONCURRENCY`` slots (``settings.NEWSAPI_MAX_CONCURRENCY``
+        for NewsAPI).  Transient failures are retried as
+        described for ``_MAX_ATTEMPTS``; the last response (successful or
+        not) is yielded to the caller, which inspects its status as before.
+
+        :param url: Request URL
+        :param kwargs: Passed through to ``ClientSession.get``
+        """
+        session = await self._get_session()
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            limit = settings.NEWSAPI_MAX_CONCURRENCY if host == _NEWSAPI_HOST else _PER_HOST_CONCURRENCY
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(max(1, limit))
+        async with semaphore:
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    resp = await session.get(url, **kwargs)
+                except aiohttp.ClientConnectionError as e:
+                    if attempt >= _MAX_ATTEMPTS:
+                        raise
+                    delay = 2 ** (attempt - 1) + random.random()
+                    logger.warning(f"Request to {host} failed ({e}); retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                if resp.status in _RETRY_STATUSES and attempt < _MAX_ATTEMPTS:
+                    delay = _retry_delay(resp, attempt)
+                    if delay is not None:
+                        resp.release()
+                        logger.warning(f"{host} responded with status {resp.status}; retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        continue
+                break
             try:
-                key_val = getattr(settings, key_attr)
-            except AttributeError:
-                key_val = None
-            if key_val:
-                self.newsapi_keys.append(key_val)
-        # Fallback: also check for alternative environment variable names
-        # like NEWS_API, NEWS_API_1, NEWS_API_2. Some
-        # deployments may define API keys using these names.  We use
-        # os.getenv directly here to avoid adding more fields to settings.
-        import os
-        for fallback_name in ["NEWS_API", "NEWS_API_1", "NEWS_API_2"]:
-            val = os.getenv(fallback_name)
-            if val and val not in self.newsapi_keys:
-                self.newsapi_keys.append(val)
-
-        # Index used to track which key is currently active when
-        # sequentially iterating through multiple keys.  This is not
-        # currently used directly but retained for future enhancement.
-        self._api_key_index: int = 0
+                yield resp
+            finally:
+                resp.release()
     
-    async def _legacy_fetch_articles(self, topics: List[str], sources: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    async def _newsapi_get(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Query a NewsAPI endpoint, rotating through the configured API keys.
+
+        Keys are tried in order and a key answering 429 (quota exhausted)
+        hands over to the next one.  Any other response ends the rotation:
+        a 200 is decoded and returned, other statuses are logged.  When
+        every key was rate limited, NewsAPI is marked as rate limited (for
+        the shortest ``Retry-After`` the keys reported, if any) so later
+        calls skip it.
+
+        :param endpoint: Endpoint name below ``/v2/`` (e.g. "everything")
+        :param params: Query parameters, without ``apiKey``
+        :return: The decoded response body, or ``None`` on failure
+        """
+        url = f"https://newsapi.org/v2/{endpoint}"
+        attempted = rate_limited = 0
+        # Shortest ``Retry-After`` among the rate-limited keys: NewsAPI is
+        # usable again as soon as any one of them is.
+        retry_after: Optional[str] = None
+        retry_window: Optional[float] = None
+        for key in self.newsapi_keys:
+            # A concurrent request may have exhausted the quota while this
+            # one was queued; stop rather than spend another request on it.
+            if self.newsapi_rate_limited:
+                return None
+            attempted += 1
+            try:
+                async with self._request(url, params={**params, "apiKey": key}) as resp:
+                    if resp.status == 429:
+                        # Try the next key if available
+                        rate_limited += 1
+                        header = resp.headers.get("Retry-After")
+                        window = _parse_retry_after(header)
+                        if window is not None and (retry_window is None or window < retry_window):
+                            retry_after, retry_window = header, window
+                        text = await _error_body(resp)
+                        logger.warning(f"NewsAPI key exhausted (429): {text}")
+                        continue
+                    if resp.status != 200:
+                        text = await _error_body(resp)
+                        logger.warning(f"NewsAPI /v2/{endpoint} responded with status {resp.status}: {text}")
+                        return None
+                    return _loads(await resp.read())
+            except Exception as e:
+                logger.error(f"Error querying NewsAPI /v2/{endpoint}: {e}")
+        # Only a full round of 429s means the quota is gone; network errors
+        # do not.
+        if attempted and rate_limited == attempted:
+            self._mark_rate_limited(retry_after)
+        return None
+
+    async def _legacy_fetch_articles(self, topics: List[str], sources: List[Dict[str, Any]], count: int) -> List[Article]:
         """
         Legacy article fetching pipeline used prior to the introduction of
         global/local modes.  This method consults the NewsAPI (using the
@@ -150,43 +1205,41 @@ class NewsAggregator:
         # Build a list of valid NewsAPI source identifiers.  Attempt to
         # discover unknown identifiers when possible and cache new mappings.
         valid_source_ids: List[tuple[str, str]] = []
+        discovered_any = False
+        # Unknown names are all resolved against one copy of the NewsAPI
+        # source catalogue instead of one discovery call per source.  Skip
+        # the download if we have already hit the NewsAPI rate limit.
+        catalogue: Optional[_SourceCatalogue] = None
+        if (
+            settings.NEWS_API_KEY
+            and not self.newsapi_rate_limited
+            and any(s.get("name") and s.get("name") not in self.newsapi_source_map for s in sources)
+        ):
+            try:
+                catalogue = await self._get_newsapi_sources()
+            except Exception as e:
+                logger.warning(f"Error fetching the NewsAPI source catalogue: {e}")
         for source in sources:
             name = source.get("name")
             if not name:
                 continue
             source_id = self.newsapi_source_map.get(name)
-            if not source_id:
-                # Skip API discovery if we have already hit the NewsAPI rate limit.
-                if not self.newsapi_rate_limited:
-                    try:
-                        # Attempt to discover the API ID via NewsAPI sources
-                        discovered = await self.discover_api_for_source(name)
-                        if discovered:
-                            self.newsapi_source_map[name] = discovered
-                            source_id = discovered
-                            # Persist the new mapping to disk for future reuse
-                            try:
-                                import json, os
-                                cache_path = os.path.join(os.path.dirname(__file__), "newsapi_source_map.json")
-                                # Load existing cache if present
-                                cached_map: Dict[str, str] = {}
-                                if os.path.exists(cache_path):
-                                    with open(cache_path, "r", encoding="utf-8") as f:
-                                        try:
-                                            cached_map = json.load(f) or {}
-                                        except Exception:
-                                            cached_map = {}
-                                cached_map[name] = discovered
-                                with open(cache_path, "w", encoding="utf-8") as f:
-                                    json.dump(cached_map, f, indent=2)
-                            except Exception as e:
-                                logger.warning(f"Failed to persist discovered API mapping for {name}: {e}")
-                    except Exception as e:
-                        logger.warning(f"Error discovering API ID for source '{name}': {e}")
+            if not source_id and catalogue:
+                discovered = catalogue.match(name)
+                if discovered:
+                    self.newsapi_source_map[name] = discovered
+                    self._discovered_sources[name] = discovered
+                    discovered_any = True
+                    source_id = discovered
             if source_id:
                 valid_source_ids.append((name, source_id))
 
-        collected: List[Dict[str, Any]] = []
+        # Persist all new mappings to disk for future reuse in a single
+        # background write; fetching does not wait for it.
+        if discovered_any:
+            self._schedule_source_flush()
+
+        collected: List[Article] = []
 
         # Attempt to fetch from NewsAPI if credentials and valid sources exist.
         # Only one attempt is made; if it fails to return sufficient articles or
@@ -214,23 +1267,8 @@ class NewsAggregator:
         # articles are obtained from the NewsAPI, the collected list will
         # remain empty and downstream handlers will handle the situation.
 
-        # Deduplicate by URL
-        unique_articles: List[Dict[str, Any]] = []
-        seen_urls = set()
-        seen_titles = set()
-        for article in collected:
-            url = article.get("url")
-            title = (article.get("title") or "").strip().lower()
-            # Skip if URL or title is missing or we've seen it already
-            if not url or url in seen_urls or (title and title in seen_titles):
-                continue
-            seen_urls.add(url)
-            if title:
-                seen_titles.add(title)
-            unique_articles.append(article)
-
-        # Sort by published date descending if available
-        unique_articles.sort(key=lambda x: x.get("published_at", ""), reverse=True)
+        # Deduplicate by URL and headline
+        unique_articles = _dedup(collected, by_title=True)
 
         # Return an empty list if no articles were collected.  Downstream
         # handlers can decide how to handle the absence of content (e.g., by
@@ -238,10 +1276,11 @@ class NewsAggregator:
         if not unique_articles:
             return []
 
-        # Return up to twice the requested count to give AI more context
-        return unique_articles[: count * 2]
+        # Return up to twice the requested count (newest first) to give AI
+        # more context
+        return _newest(unique_articles, count * 2)
 
-    async def _fetch_global_articles(self, topic: str, count: int, page: int = 1, language: str = "en") -> List[Dict[str, Any]]:
+    async def _fetch_global_articles(self, topic: str, count: int, page: int = 1, language: str = "en") -> List[Article]:
         """
         Fetch a list of articles for a given topic from the NewsAPI ``/v2/everything``
         endpoint.  This helper always sorts results by popularity and restricts
@@ -251,86 +1290,40 @@ class NewsAggregator:
         :param topic: Search keyword or topic
         :param count: Desired number of articles to return
         :param language: ISO language code (e.g. "en")
-        :return: List of article dicts
+        :return: List of articles, newest first
         """
-        # Skip if we've already marked the API as rate-limited
-        if self.newsapi_rate_limited:
-            return []
-        # Compute the date range for the past seven days
-        from_date = (datetime.utcnow() - timedelta(days=7)).strftime("%Y-%m-%d")
+        # Compute the date range for the past seven days.  ``now`` and the
+        # cutoff are taken once per call rather than per article.
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=7)
+        from_date = cutoff.strftime("%Y-%m-%d")
         page_size = max(1, min(count * 2, 100))
-        all_articles: List[Dict[str, Any]] = []
-        # Track whether we encountered a 429 across all keys
-        encountered_rate_limit = True
-        # Iterate through all available API keys until we get a successful response
-        for key in self.newsapi_keys:
-            if not key:
-                continue
-            url = (
-                "https://newsapi.org/v2/everything"
-                f"?q={aiohttp.helpers.quote(topic)}"
-                f"&language=en"
-                f"&from={from_date}"
-                f"&sortBy=popularity"
-                f"&pageSize={page_size}"
-                f"&page={page}"
-                f"&apiKey={key}"
-            )
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as resp:
-                        if resp.status == 429:
-                            # Try the next key if available
-                            text = await resp.text()
-                            logger.warning(f"NewsAPI key exhausted (429): {text}")
-                            continue
-                        encountered_rate_limit = False
-                        if resp.status != 200:
-                            text = await resp.text()
-                            logger.warning(f"NewsAPI /v2/everything responded with status {resp.status}: {text}")
-                            break
-                        data = await resp.json()
-                        for item in data.get("articles", []):
-                            published_at = item.get("publishedAt") or datetime.utcnow().isoformat()
-                            try:
-                                published_dt = datetime.fromisoformat(published_at.rstrip("Z"))
-                            except Exception:
-                                published_dt = datetime.utcnow()
-                            if published_dt < datetime.utcnow() - timedelta(days=7):
-                                continue
-                            all_articles.append({
-                                "title": item.get("title", ""),
-                                "content": item.get("description") or item.get("content") or "",
-                                "url": item.get("url", ""),
-                                "source": item.get("source", {}).get("name", ""),
-                                "published_at": published_at,
-                                "metadata": {
-                                    "author": item.get("author"),
-                                    "source_name": item.get("source", {}).get("name"),
-                                },
-                            })
-                        # Successful fetch; break the loop
-                        break
-            except Exception as e:
-                logger.error(f"Error fetching global articles with key {key}: {e}")
-                continue
-        # If all keys resulted in 429, mark the service as rate limited
-        if encountered_rate_limit:
-            self.newsapi_rate_limited = True
-            return []
-        # Deduplicate and sort
-        unique: List[Dict[str, Any]] = []
-        seen = set()
-        for art in all_articles:
-            url = art.get("url")
-            if not url or url in seen:
-                continue
-            seen.add(url)
-            unique.append(art)
-        unique.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-        return unique[:count]
+        # aiohttp encodes the query, so topics with spaces, ``&`` or
+        # non-ASCII characters reach NewsAPI intact.
+        params = {
+            "q": topic,
+            "language": "en",
+            "from": from_date,
+            "sortBy": "popularity",
+            "pageSize": page_size,
+            "page": page,
+        }
+
+        async def fetch() -> Optional[List[Article]]:
+            data = await self._newsapi_get("everything", params)
+            if data is None:
+                return None
+            # Deduplicate and sort; the whole page is cached and trimmed to
+            # ``count`` per caller.
+            articles = _dedup(_newsapi_articles(data, now, cutoff.timestamp()))
+            return _newest(articles, len(articles))
 
-    async def _fetch_local_headlines(self, topic: str, count: int, page: int = 1, country: Optional[str] = None, language: str = "en") -> List[Dict[str, Any]]:
+        # Fresh cached responses are served even while NewsAPI is rate
+        # limited; ``_newsapi_get`` skips the request itself in that case.
+        cached = await self._cached_fetch(_request_key("everything", params), fetch)
+        return cached[:count]
+
+    async def _fetch_local_headlines(self, topic: str, count: int, page: int = 1, country: Optional[str] = None, language: str = "en") -> List[Article]:
         """
         Fetch top headlines for a given topic from the NewsAPI ``/v2/top-headlines``
         endpoint.  Results are filtered by the supplied country code and
@@ -342,81 +1335,37 @@ class NewsAggregator:
         :param count: Desired number of articles to return
         :param country: Two‑letter ISO country code (e.g. "US")
         :param language: ISO language code
-        :return: List of article dicts
+        :return: List of articles, newest first
         """
-        if self.newsapi_rate_limited or not country:
+        if not country:
             return []
         # Derive a NewsAPI category from the topic using the existing helper.
         derived_category = self._get_topic_category(topic)
         valid_categories = {"business", "entertainment", "general", "health", "science", "sports", "technology"}
-        category_param = ""
-        if derived_category.lower() in valid_categories:
-            category_param = f"&category={aiohttp.helpers.quote(derived_category.lower())}"
+        category = derived_category.lower() if derived_category.lower() in valid_categories else None
         page_size = max(1, min(count * 2, 100))
-        all_articles: List[Dict[str, Any]] = []
-        encountered_rate_limit = True
-        for key in self.newsapi_keys:
-            if not key:
-                continue
-            url = (
-                "https://newsapi.org/v2/top-headlines"
-                f"?country={country.upper()}"
-                f"&language=en"
-                f"&pageSize={page_size}"
-                f"&page={page}"
-                f"{category_param}"
-                f"&apiKey={key}"
-            )
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as resp:
-                        if resp.status == 429:
-                            text = await resp.text()
-                            logger.warning(f"NewsAPI key exhausted (429): {text}")
-                            continue
-                        encountered_rate_limit = False
-                        if resp.status != 200:
-                            text = await resp.text()
-                            logger.warning(f"NewsAPI /v2/top-headlines responded with status {resp.status}: {text}")
-                            break
-                        data = await resp.json()
-                        for item in data.get("articles", []):
-                            published_at = item.get("publishedAt") or datetime.utcnow().isoformat()
-                            try:
-                                published_dt = datetime.fromisoformat(published_at.rstrip("Z"))
-                            except Exception:
-                                published_dt = datetime.utcnow()
-                            if published_dt < datetime.utcnow() - timedelta(days=7):
-                                continue
-                            all_articles.append({
-                                "title": item.get("title", ""),
-                                "content": item.get("description") or item.get("content") or "",
-                                "url": item.get("url", ""),
-                                "source": item.get("source", {}).get("name", ""),
-                                "published_at": published_at,
-                                "metadata": {
-                                    "author": item.get("author"),
-                                    "source_name": item.get("source", {}).get("name"),
-                                },
-                            })
-                        break
-            except Exception as e:
-                logger.error(f"Error fetching local headlines with key {key}: {e}")
-                continue
-        if encountered_rate_limit:
-            self.newsapi_rate_limited = True
-            return []
-        # Deduplicate and sort
-        unique: List[Dict[str, Any]] = []
-        seen = set()
-        for art in all_articles:
-            url = art.get("url")
-            if not url or url in seen:
-                continue
-            seen.add(url)
-            unique.append(art)
-        unique.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-        return unique[:count]
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=7)
+        params = {
+            "country": country.upper(),
+            "language": "en",
+            "pageSize": page_size,
+            "page": page,
+        }
+        if category:
+            params["category"] = category
+
+        async def fetch() -> Optional[List[Article]]:
+            data = await self._newsapi_get("top-headlines", params)
+            if data is None:
+                return None
+            # Deduplicate and sort; the whole page is cached and trimmed to
+            # ``count`` per caller.
+            articles = _dedup(_newsapi_articles(data, now, cutoff.timestamp()))
+            return _newest(articles, len(articles))
+
+        cached = await self._cached_fetch(_request_key("top-headlines", params), fetch)
+        return cached[:count]
 
     async def fetch_articles(self,
         topic: Any,
@@ -451,79 +1400,101 @@ class NewsAggregator:
         if sources is not None and (mode is None or mode not in {"global", "local"}):
             # Ensure topic is a list when using legacy fetch
             topics_list = topic if isinstance(topic, list) else [str(topic)]
-            return await self._legacy_fetch_articles(topics_list, sources, count)
+            legacy = await self._legacy_fetch_articles(topics_list, sources, count)
+            return [article.to_dict() for article in legacy]
 
         # Normalize topics into a list for iteration
         topics_list: List[str] = topic if isinstance(topic, list) else [str(topic)]
 
-        collected: List[Dict[str, Any]] = []
-        for t in topics_list:
-            if mode == "local":
-                # For local mode we must have a country; skip if not provided
-                if not country:
-                    continue
-                fetched = await self._fetch_local_headlines(t, count, page=page, country=country, language=language)
-            else:
-                fetched = await self._fetch_global_articles(t, count, page=page, language=language)
+        # The per-topic queries are independent, so issue them concurrently;
+        # the per-host limit in ``_request`` keeps the fan-out polite.
+        if mode == "local":
+            # For local mode we must have a country; skip if not provided
+            requests = [
+                self._fetch_local_headlines(t, count, page=page, country=country, language=language)
+                for t in topics_list
+            ] if country else []
+        else:
+            requests = [
+                self._fetch_global_articles(t, count, page=page, language=language)
+                for t in topics_list
+            ]
+        collected: List[Article] = []
+        for fetched in await asyncio.gather(*requests, return_exceptions=True):
+            if isinstance(fetched, Exception):
+                logger.error(f"Error fetching articles: {fetched}")
+                continue
             collected.extend(fetched)
 
         # Remove duplicates by URL
-        unique_articles: List[Dict[str, Any]] = []
-        seen_urls = set()
-        for article in collected:
-            url = article.get("url")
-            if not url or url in seen_urls:
-                continue
-            seen_urls.add(url)
-            unique_articles.append(article)
-
-        # Sort by published date descending
-        unique_articles.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-
-        # If we didn't collect any articles from the NewsAPI and a fallback is
-        # available, attempt to gather articles from RSS feeds.  We build a
-        # list of source dicts using the keys of ``rss_feed_map``.  The
-        # resulting articles will still be filtered by topics_list and
-        # deduplicated.  RSS parsing may be slower, so this block is
-        # executed only when the API yields no content.
-        if not unique_articles and mode == 'global':    # Current RSS not valid for local search
+        unique_articles = _dedup(collected)
+
+        # RSS feeds back up NewsAPI, which often returns nothing or only a
+        # handful of items: when it comes back short of ``count``, top the
+        # result up from the feeds.  NewsAPI articles come first so they win
+        # when both carry a story.  Every feed is fetched once and matched
+        # against all topics; ``count`` articles are requested per topic to
+        # over‑fetch and allow downstream ranking, and the fetch stops as
+        # soon as enough articles have arrived instead of waiting for the
+        # slowest of the feeds.
+        if len(unique_articles) < count and mode == 'global':    # Current RSS not valid for local search
+            rss_sources = [{"name": name} for name in self.rss_feed_map.keys()]
             try:
-                # Build a generic sources list for RSS based on all known feeds
-                rss_sources = [{"name": name} for name in self.rss_feed_map.keys()]
-                rss_articles: List[Dict[str, Any]] = []
-                # Fetch RSS articles for each topic; the helper already handles
-                # per-source filtering and deduplication.  We request count
-                # articles per topic to over‑fetch and allow downstream ranking.
-                for t in topics_list:
-                    fetched = await self._fetch_rss_articles([t], rss_sources, count)
-                    rss_articles.extend(fetched)
-                # Deduplicate and sort RSS articles by published_at descending
-                seen_rss = set()
-                deduped_rss: List[Dict[str, Any]] = []
-                for art in rss_articles:
-                    url = art.get("link")
-                    if not url or url in seen_rss:
-                        continue
-                    seen_rss.add(url)
-                    deduped_rss.append(art)
-                deduped_rss.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-                # Return up to 2× count to allow AI ranking later
-                return deduped_rss[: max(1, count * 2)]
+                rss_articles = await self._fetch_rss_articles(
+                    topics_list,
+                    rss_sources,
+                    count * max(1, len(topics_list)),
+                    stop_after=max(1, count * 2),
+                )
             except Exception as e:
                 logger.error(f"Error fetching RSS fallback articles: {e}")
-                # Return empty list; upstream will handle with 404
-                return []
-        # Return up to the requested count * 2 to give the AI additional context
-        return unique_articles[: max(1, count * 2)]
+            else:
+                unique_articles = _dedup(unique_articles + rss_articles)
+        # Return up to the requested count * 2 (newest first) to give the AI
+        # additional context
+        return [article.to_dict() for article in _newest(unique_articles, max(1, count * 2))]
+
+    async def _get_newsapi_sources(self) -> Optional[_SourceCatalogue]:
+        """
+        Return the NewsAPI source catalogue, indexed by lower-cased name and
+        by the words in each name.
+
+        The ``/v2/sources`` listing is large and changes rarely, so it is
+        downloaded at most once every ``_SOURCES_CACHE_TTL`` seconds.  A lock
+        makes concurrent callers share a single download.  Failed downloads
+        are not cached.
+
+        :return: The catalogue, or ``None`` if it could not be fetched
+        """
+        async with self._sources_lock:
+            cached = self._sources_cache
+            if cached is not None and time.monotonic() - cached.fetched_at < _SOURCES_CACHE_TTL:
+                return cached
+            async with self._request(
+                "https://newsapi.org/v2/sources", params={"apiKey": settings.NEWS_API_KEY}
+            ) as resp:
+                if resp.status != 200:
+                    # If a rate limit (HTTP 429) response is returned, mark
+                    # NewsAPI as rate limited so future requests are skipped
+                    # until the window passes.  This prevents repeated
+                    # queries once the free quota has been exhausted.
+                    if resp.status == 429:
+                        self._mark_rate_limited(resp.headers.get("Retry-After"))
+                    text = await _error_body(resp)
+                    logger.warning(f"NewsAPI sources request failed with status {resp.status}: {text}")
+                    return None
+                data = _loads(await resp.read())
+            self._sources_cache = _SourceCatalogue.from_sources(data.get("sources", []))
+            return self._sources_cache
 
     async def discover_api_for_source(self, source_name: str) -> Optional[str]:
         """
         Attempt to discover the NewsAPI source identifier for a human‑readable
         source name.
 
-        This implementation queries the NewsAPI ``/v2/sources`` endpoint using
-        the provided ``NEWS_API_KEY`` and searches the returned list of
-        sources for one whose name contains the requested source_name.  If a
+        This implementation looks the name up in the (cached) NewsAPI
+        ``/v2/sources`` catalogue, first by exact name and then by searching
+        for a source whose name contains the requested source_name.  If a
         matching source is found, its ``id`` is returned.  When no API key
         is available or no match exists, ``None`` is returned.
 
@@ -531,271 +1502,420 @@ class NewsAggregator:
         :return: A NewsAPI source ID if discovered, otherwise None
         """
         # Without an API key we cannot query the NewsAPI for sources
-        api_key = settings.NEWS_API_KEY
-        if not api_key:
+        if not settings.NEWS_API_KEY:
             return None
-        # Normalize the search term for comparison
-        search_term = source_name.lower()
-        url = f"https://newsapi.org/v2/sources?apiKey={api_key}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    # If a rate limit (HTTP 429) response is returned, set the
-                    # newsapi_rate_limited flag so future NewsAPI requests can be
-                    # skipped.  This prevents repeated queries once the free
-                    # quota has been exhausted.
-                    if resp.status == 429:
-                        self.newsapi_rate_limited = True
-                    try:
-                        text = await resp.text()
-                    except Exception:
-                        text = ""
-                    logger.warning(f"NewsAPI sources request failed with status {resp.status}: {text}")
-                    return None
-                data = await resp.json()
-                for src in data.get("sources", []):
-                    name = src.get("name", "")
-                    if search_term in name.lower():
-                        return src.get("id")
-        return None
+        sources = await self._get_newsapi_sources()
+        if not sources:
+            return None
+        return sources.match(source_name)
 
-    async def _fetch_real_articles(self, topics: List[str], sources: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    async def _fetch_real_articles(self, topics: List[str], sources: List[Dict[str, Any]], count: int) -> List[Article]:
         """
         Fetch articles from a real news API (e.g. NewsAPI.org).  The number of
         articles returned is limited by ``count`` times the number of topics
         and sources.  Only sources present in ``self.newsapi_source_map``
         will be queried.
 
+        All topics are combined into a single ``OR`` query and the sources
+        are passed as a comma-separated list, up to
+        ``_NEWSAPI_SOURCES_PER_REQUEST`` per request, which saves both round
+        trips and NewsAPI quota.  When more sources are selected the
+        requests are independent, so they run concurrently over the shared
+        session, bounded by the NewsAPI host limit in ``_request``.
+
+        Results within a request are sorted by publication time, so one
+        outlet that publishes often could take every slot.  Each request
+        therefore asks for the full ``count * 2`` articles, and each source
+        is then capped at its share of them.
+
         :param topics: List of topics provided by the user
         :param sources: List of source dicts (with at least a 'name' key)
         :param count: Desired number of articles per user request
         :return: List of articles in the expected format
         """
         api_key = settings.NEWS_API_KEY
-        real_articles: List[Dict[str, Any]] = []
-        max_per_request = max(1, count // max(1, len(topics) * len(sources)))
-        async with aiohttp.ClientSession() as session:
-            # Compute the date range for the past seven days.  The NewsAPI
-            # accepts a `from` parameter specifying the earliest publication
-            # time; omit the `to` parameter to default to the current time.
-            from_date = (datetime.utcnow() - timedelta(days=7)).strftime("%Y-%m-%d")
-            for topic in topics:
-                for source in sources:
-                    source_name = source.get("name")
-                    source_id = self.newsapi_source_map.get(source_name)
-                    if not source_id:
-                        continue  # skip sources we don't have an ID for
-                    url = (
-                        "https://newsapi.org/v2/everything"
-                        f"?q={topic}&sources={source_id}&pageSize={max_per_request}"
-                        "&sortBy=publishedAt"
-                        f"&from={from_date}"
-                        f"&apiKey={api_key}"
-                    )
-                    async with session.get(url) as resp:
-                        if resp.status != 200:
-                            # If the NewsAPI request returns a rate limit error
-                            # (HTTP 429), mark the aggregator so that future
-                            # NewsAPI calls are skipped.  Otherwise just log the
-                            # error and continue.  Note that we still read
-                            # the response text to aid debugging.
-                            if resp.status == 429:
-                                self.newsapi_rate_limited = True
-                            text = await resp.text()
-                            logger.warning(f"NewsAPI responded with status {resp.status}: {text}")
-                            continue
-                        data = await resp.json()
-                        for item in data.get("articles", []):
-                            # Skip articles published more than seven days ago
-                            published_at = item.get("publishedAt") or datetime.utcnow().isoformat()
-                            try:
-                                published_dt = datetime.fromisoformat(published_at.rstrip("Z"))
-                            except Exception:
-                                published_dt = datetime.utcnow()
-                            if published_dt < datetime.utcnow() - timedelta(days=7):
-                                continue
-                            real_articles.append({
-                                "title": item.get("title", ""),
-                                "content": item.get("description") or item.get("content") or "",
-                                "url": item.get("url", ""),
-                                "source": source_name,
-                                "published_at": published_at,
-                                "metadata": {
-                                    "author": item.get("author"),
-                                    "source_name": item.get("source", {}).get("name"),
-                                },
-                            })
-        # Sort articles by publication date descending and limit output
-        real_articles.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-        # Return more articles than requested so AI can filter
-        return real_articles[: count * 2]
-
-    async def _fetch_rss_articles(self, topics: List[str], sources: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
-        """
-        Fetch articles from RSS feeds for the given sources and topics.  This
-        implementation relies on feedparser to download and parse the feed
-        directly, mirroring the behaviour found in the semi‑stable reference
-        version of the project.  It filters entries to only include those
-        mentioning one of the user‑provided topics and ignores articles older
-        than one week.
+        page_size = max(1, min(100, count * 2))
+        # NewsAPI accepts boolean queries; parenthesize each topic so a
+        # multi‑word topic keeps its "all of these words" meaning.
+        query = topics[0] if len(topics) == 1 else " OR ".join(f"({t})" for t in topics)
+        timeout = aiohttp.ClientTimeout(total=10)
+        # Compute the date range for the past seven days.  The NewsAPI
+        # accepts a `from` parameter specifying the earliest publication
+        # time; omit the `to` parameter to default to the current time.
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=7)
+        cutoff_ts = cutoff.timestamp()
+        from_date = cutoff.strftime("%Y-%m-%d")
+
+        async def fetch_batch(batch: List[str]) -> List[Article]:
+            # Let aiohttp encode the query; raw topics may contain spaces,
+            # ``&`` or non-ASCII characters.
+            params = {
+                "q": query,
+                "sources": ",".join(batch),
+                "pageSize": page_size,
+                "sortBy": "publishedAt",
+                "from": from_date,
+                "apiKey": api_key,
+            }
+
+            async def fetch() -> Optional[List[Article]]:
+                # An earlier batch may already have hit the rate limit.
+                if self.newsapi_rate_limited:
+                    return None
+                async with self._request("https://newsapi.org/v2/everything", params=params, timeout=timeout) as resp:
+                    if resp.status != 200:
+                        # If the NewsAPI request returns a rate limit error
+                        # (HTTP 429), mark the aggregator so that future
+                        # NewsAPI calls are skipped.  Otherwise just log the
+                        # error and continue.  Note that we still read
+                        # the response text to aid debugging.
+                        if resp.status == 429:
+                            self._mark_rate_limited(resp.headers.get("Retry-After"))
+                        text = await _error_body(resp)
+                        logger.warning(f"NewsAPI responded with status {resp.status}: {text}")
+                        return None
+                    data = _loads(await resp.read())
+                # Skip articles published more than seven days ago
+                return _newsapi_articles(data, now, cutoff_ts, source_names=source_names)
+
+            return await self._cached_fetch(_request_key("everything", params), fetch)
+
+        # Articles are attributed to the name the caller used for their
+        # source, looked up by the source ID NewsAPI reports.
+        source_names: Dict[str, str] = {}
+        for source in sources:
+            name = source.get("name")
+            source_id = self.newsapi_source_map.get(name) if name else None
+            if source_id and source_id not in source_names:
+                source_names[source_id] = name
+        source_ids = list(source_names)
+        results = await asyncio.gather(
+            *(
+                fetch_batch(source_ids[i:i + _NEWSAPI_SOURCES_PER_REQUEST])
+                for i in range(0, len(source_ids), _NEWSAPI_SOURCES_PER_REQUEST)
+            ),
+            return_exceptions=True,
+        )
+
+        real_articles: List[Article] = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"NewsAPI request failed: {result}")
+                continue
+            real_articles.extend(result)
+        # The same story is often syndicated across sources; drop repeats
+        # before ranking.
+        real_articles = _dedup(real_articles)
+        # Keep each source to its share of the ``count * 2`` articles,
+        # newest first, split over the sources actually queried.
+        per_source = max(1, -(-count * 2 // max(1, len(source_ids))))
+        taken: Dict[str, int] = {}
+        capped: List[Article] = []
+        for article in _newest(real_articles, len(real_articles)):
+            if taken.get(article.source, 0) < per_source:
+                taken[article.source] = taken.get(article.source, 0) + 1
+                capped.append(article)
+        # Return the newest articles, more than requested so AI can filter
+        return capped[: count * 2]
+
+    async def _fetch_rss_feed(self, name: str, feed_url: str, cutoff: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Download and parse a single RSS/Atom feed.
+
+        The feed is downloaded over the shared session and read by the
+        streaming RSS/Atom parser in the parser process pool.  Malformed
+        feeds are handed to feedparser instead, and when
+        feedparser is not installed or fails, a minimal ElementTree parser
+        reads the same document.  All paths return the
+        same normalized entry dicts (``title``, ``description``,
+        ``summary``, ``link`` and ``published_dt``, plus ``published_ts``
+        from the parser workers).  Failures are logged
+        and yield an empty list.
+
+        :param name: Source name, used for logging
+        :param feed_url: URL of the feed
+        :param cutoff: Optional publication cutoff; older entries are
+                       dropped by the parser workers
+        :return: List of normalized entry dicts
+        """
+        cached = self._feed_cache.get(feed_url)
+        # The caller re-applies the date cutoff to reused entries.
+        if cached and time.monotonic() - cached.fetched_at < _RSS_CACHE_TTL:
+            return cached.entries
+        headers = dict(_RSS_HEADERS)
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        try:
+            async with self._request(feed_url, headers=headers) as resp:
+                if resp.status == 304 and cached:
+                    # Unchanged since the last download; reuse its entries.
+                    cached.fetched_at = time.monotonic()
+                    return cached.entries
+                if resp.status != 200:
+                    logger.warning(f"Failed to fetch RSS feed for {name}: HTTP {resp.status}")
+                    return []
+                if resp.content_length is not None and resp.content_length > _RSS_MAX_BYTES:
+                    logger.warning(f"Skipping RSS feed for {name}: {resp.content_length} bytes exceeds the {_RSS_MAX_BYTES} byte limit")
+                    return []
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+                # aiohttp transparently decompresses bodies that declare a
+                # Content-Encoding.  Read in chunks so a feed sent without a
+                # Content-Length (or a lying one) is still cut off at the
+                # size limit instead of being buffered whole.
+                chunks: List[bytes] = []
+                size = 0
+                async for chunk in resp.content.iter_chunked(_RSS_READ_CHUNK):
+                    size += len(chunk)
+                    if size > _RSS_MAX_BYTES:
+                        logger.warning(f"Skipping RSS feed for {name}: body exceeds the {_RSS_MAX_BYTES} byte limit")
+                        return []
+                    chunks.append(chunk)
+                content = b"".join(chunks)
+            # Some servers send gzip data without declaring it; detect the
+            # gzip magic number and inflate it ourselves.
+            if content[:2] == b"\x1f\x8b":
+                content = _gunzip(content)
+                if content is None:
+                    logger.warning(f"Skipping RSS feed for {name}: inflated body exceeds the {_RSS_MAX_BYTES} byte limit")
+                    return []
+        except Exception as e:
+            logger.warning(f"Failed to fetch RSS feed for {name}: {e}")
+            return []
+
+        # Servers that ignore the validators often still return a
+        # byte-identical document; skip parsing it again.
+        digest = hashlib.sha256(content).digest()
+        if cached and cached.digest == digest:
+            cached.etag, cached.last_modified = etag, last_modified
+            cached.fetched_at = time.monotonic()
+            return cached.entries
+
+        entries: Optional[List[Dict[str, Any]]] = None
+        cutoff_fields = cutoff.timetuple()[:6] if cutoff else None
+        # Primary path: stream the RSS items in the parser process pool so
+        # the event loop stays free.
+        try:
+            error, parsed = await _run_in_parse_pool(
+                _parse_rss_items, content, cutoff_fields
+            )
+            if error is None:
+                entries = parsed
+        except Exception as e:
+            logger.warning(f"Failed to parse RSS feed for {name}: {e}")
+        # Malformed or unrecognized feeds: let feedparser have a go.
+        if entries is None and feedparser is not None:
+            try:
+                error, entries = await _run_in_parse_pool(
+                    _parse_feed, content, cutoff_fields
+                )
+                # Skip malformed feeds
+                if error:
+                    logger.warning(f"Failed to parse RSS feed for {name}: {error}")
+                    return []
+            except Exception as e:
+                logger.warning(f"Failed to parse RSS feed for {name}: {e}")
+                entries = None
+                # Fall through to manual parsing
+        # Fallback path: manually parse the feed if feedparser is not
+        # available or failed above.
+        if entries is None:
+            entries = []
+            try:
+                # Parse XML
+                try:
+                    root = ET.fromstring(content)
+                except Exception as e:
+                    logger.warning(f"Failed to parse RSS XML for {name}: {e}")
+                    return []
+                # RSS 2.0 items are under channel/item; Atom entries under feed/entry
+                items = root.findall('.//item')
+                if not items:
+                    items = root.findall('.//entry')
+                for item in items:
+                    title = (item.findtext('title') or '').strip()
+                    description = (item.findtext('description') or item.findtext('summary') or '').strip()
+                    # Some Atom feeds use <content> for full description
+                    if not description:
+                        desc_elem = item.find('content')
+                        description = (desc_elem.text or '').strip() if desc_elem is not None else ''
+                    pub_str = item.findtext('pubDate') or item.findtext('published') or item.findtext('updated')
+                    # Attempt to parse publication date using email.utils
+                    # helper; entries left undated are dropped later
+                    published_dt = None
+                    if pub_str:
+                        try:
+                            pub_dt = parsedate_to_datetime(pub_str)
+                            # Normalize offsets to UTC; naive values are
+                            # treated as UTC when the timestamp is taken
+                            published_dt = pub_dt.astimezone(timezone.utc) if pub_dt.tzinfo else pub_dt
+                        except Exception:
+                            published_dt = None
+                    entries.append({
+                        'title': title,
+                        'description': description,
+                        'summary': description,
+                        'link': None,  # placeholder
+                        'published_dt': published_dt
+                    })
+                # Extract link separately because <link> structure can vary
+                for idx, item in enumerate(items):
+                    link = ''
+                    link_elem = item.find('link')
+                    if link_elem is not None:
+                        # Atom format: <link href="..."/>
+                        href = link_elem.get('href')
+                        if href and href.strip().startswith("http"):
+                            link = href.strip()
+                        elif link_elem.text and link_elem.text.strip().startswith("http"):
+                            # RSS 2.0 format: <link>https://...</link>
+                            link = link_elem.text.strip()
+                    if not link:
+                        logger.warning(f"Skipping article due to missing or invalid link in source '{name}'")
+                        continue
+                    entries[idx]['link'] = link
+            except Exception as e:
+                logger.warning(f"Error fetching/parsing RSS feed for {name}: {e}")
+                return []
+        self._feed_cache[feed_url] = _CachedFeed(etag, last_modified, digest, entries, time.monotonic())
+        return entries
+
+    async def _fetch_rss_articles(self, topics: List[str], sources: List[Dict[str, Any]], count: int, stop_after: Optional[int] = None) -> List[Article]:
+        """
+        Fetch articles from RSS feeds for the given sources and topics.  Each
+        feed is read by the streaming RSS/Atom parser in the parser process
+        pool; feedparser (and then a minimal ElementTree parser) is only a
+        fallback for feeds it cannot handle (see ``_fetch_rss_feed``).  It
+        filters entries to only include those mentioning one of the
+        user‑provided topics and ignores undated articles and those older
+        than one week.  All feeds are downloaded concurrently and processed as
+        they arrive.
 
         :param topics: List of user topics
         :param sources: List of source dicts
         :param count: Desired article count
+        :param stop_after: If given, stop once this many articles have been
+                           collected and cancel the feeds still in flight,
+                           trading completeness for latency
         :return: List of articles
         """
-        articles: List[Dict[str, Any]] = []
+        articles: List[Article] = []
+        seen_urls = set()
+        # All topic keywords are matched with a single compiled
+        # case-insensitive alternation, so each entry is checked with one
+        # C-level scan rather than a Python loop of substring tests.
+        topic_keywords = frozenset(t.strip() for t in topics if t and t.strip())
+        topic_re = _topic_pattern(topic_keywords) if topic_keywords else None
+
+        # Fetch each feed URL only once, even if several source names (or a
+        # repeated source) resolve to it.
+        feeds_by_url: Dict[str, str] = {}
+        for source in sources:
+            name = source.get("name")
+            feed_url = self.rss_feed_map.get(name) if name else None
+            if feed_url and feed_url not in feeds_by_url:
+                feeds_by_url[feed_url] = name
+        feeds = [(name, feed_url) for feed_url, name in feeds_by_url.items()]
         # Determine how many articles to retrieve from each feed.  We fetch
-        # twice the per‑source count to allow for filtering below.
-        max_per_source = max(1, count // max(1, len(sources)))
-        topic_keywords = [t.lower() for t in topics]
+        # twice the per‑source count to allow for filtering below.  The
+        # share is split over the feeds actually fetched, not over every
+        # requested source, so sources without a feed do not shrink it.
+        max_per_source = max(1, count // max(1, len(feeds)))
+        semaphore = asyncio.Semaphore(_RSS_MAX_CONCURRENCY)
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=7)
+        cutoff_ts = cutoff.timestamp()
 
-        # Attempt to import feedparser once.  If unavailable, we'll fall
-        # back to a manual RSS parser below.
+        async def fetch_bounded(name: str, feed_url: str) -> Tuple[str, List[Dict[str, Any]]]:
+            async with semaphore:
+                return name, await self._fetch_rss_feed(name, feed_url, cutoff)
+
+        tasks = [asyncio.create_task(fetch_bounded(name, feed_url)) for name, feed_url in feeds]
         try:
-            import feedparser  # type: ignore
-            feedparser_available = True
-        except ImportError:
-            feedparser_available = False
+            for next_feed in asyncio.as_completed(tasks):
+                name, entries = await next_feed
+                self._collect_rss_entries(
+                    name, entries, max_per_source * 2, topic_re, cutoff_ts, seen_urls, articles
+                )
+                if stop_after is not None and len(articles) >= stop_after:
+                    break
+        finally:
+            # Cancel whatever is still downloading after an early stop (or
+            # an error); it is no longer needed.
+            for task in tasks:
+                task.cancel()
 
-        for source in sources:
-            name = source.get("name")
-            if not name:
+        # Return the newest entries, twice the requested count to allow for
+        # downstream ranking
+        return _newest(articles, count * 2)
+
+    @staticmethod
+    def _collect_rss_entries(
+        name: str,
+        entries: List[Dict[str, Any]],
+        limit: int,
+        topic_re: Optional["re.Pattern[str]"],
+        cutoff_ts: float,
+        seen_urls: set,
+        articles: List[Article],
+    ) -> None:
+        """
+        Append the fresh, on‑topic and not yet seen entries of one feed to
+        ``articles``, stopping once ``limit`` of them have been taken.
+
+        The limit applies to matching entries rather than to the head of
+        the feed, so a feed whose first items are off-topic still
+        contributes, and the scan ends as soon as the feed has supplied
+        its share.  Undated entries are skipped: without a date they can
+        neither be checked against the seven-day window nor ranked.
+        """
+        taken = 0
+        # Both the feedparser worker and the manual parser produce the same
+        # normalized dicts.
+        for entry in entries:
+            title = entry.get('title', '')
+            description = entry.get('description', '') or entry.get('summary', '')
+            published_dt = entry.get('published_dt')
+            if published_dt is None:
                 continue
-            feed_url = self.rss_feed_map.get(name)
-            if not feed_url:
+            # Skip articles older than seven days before the more
+            # expensive topic scan.  The parser workers supply the
+            # timestamp; only the manual parser needs it computed here.
+            published_ts = entry.get('published_ts')
+            if published_ts is None:
+                published_ts = _utc_timestamp(published_dt)
+            if published_ts < cutoff_ts:
                 continue
-            entries: List[Any] = []
-            # Primary path: use feedparser if it's available to fetch and parse
-            if feedparser_available:
-                try:
-                    # Use feedparser to fetch and parse the RSS feed.  Pass a
-                    # browser‑like User‑Agent header to reduce the chance of being
-                    # blocked by some servers.  Feedparser accepts a
-                    # ``request_headers`` argument for this purpose.
-                    feed = feedparser.parse(feed_url, request_headers={"User-Agent": "Mozilla/5.0"})  # type: ignore
-                    # Skip malformed feeds
-                    if getattr(feed, "bozo", False):
-                        exc = getattr(feed, "bozo_exception", None)
-                        logger.warning(f"Failed to parse RSS feed for {name}: {exc}")
-                        continue
-                    entries = feed.entries
-                except Exception as e:
-                    logger.warning(f"Failed to fetch or parse RSS feed for {name}: {e}")
-                    # Fall through to manual parsing
-            # Fallback path: manually fetch and parse the RSS feed if feedparser
-            # is not available or failed above.
-            if not entries:
-                try:
-                    from aiohttp import ClientSession
-                    from xml.etree import ElementTree as ET
-                    from email.utils import parsedate_to_datetime
-                    async with ClientSession() as session:
-                        async with session.get(feed_url, headers={"User-Agent": "Mozilla/5.0"}) as resp:
-                            if resp.status != 200:
-                                logger.warning(f"Failed to fetch RSS feed for {name}: HTTP {resp.status}")
-                                continue
-                            content = await resp.read()
-                    # Parse XML
-                    try:
-                        root = ET.fromstring(content)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse RSS XML for {name}: {e}")
-                        continue
-                    # RSS 2.0 items are under channel/item; Atom entries under feed/entry
-                    items = root.findall('.//item')
-                    if not items:
-                        items = root.findall('.//entry')
-                    for item in items:
-                        title = (item.findtext('title') or '').strip()
-                        description = (item.findtext('description') or item.findtext('summary') or '').strip()
-                        # Some Atom feeds use <content> for full description
-                        if not description:
-                            desc_elem = item.find('content')
-                            description = (desc_elem.text or '').strip() if desc_elem is not None else ''
-                        pub_str = item.findtext('pubDate') or item.findtext('published') or item.findtext('updated')
-                        # Attempt to parse publication date using email.utils helper
-                        if pub_str:
-                            try:
-                                pub_dt = parsedate_to_datetime(pub_str)
-                                # Remove timezone info for comparison if present
-                                published_dt = pub_dt.replace(tzinfo=None)
-                            except Exception:
-                                published_dt = datetime.utcnow()
-                        else:
-                            published_dt = datetime.utcnow()
-                        entries.append({
-                            'title': title,
-                            'description': description,
-                            'summary': description,
-                            'link': None,  # placeholder
-                            'published_dt': published_dt
-                        })
-                    # Extract link separately because <link> structure can vary
-                    for idx, item in enumerate(items):
-                        link = ''
-                        link_elem = item.find('link')
-                        if link_elem is not None:
-                            # Atom format: <link href="..."/>
-                            href = link_elem.get('href')
-                            if href and href.strip().startswith("http"):
-                                link = href.strip()
-                            elif link_elem.text and link_elem.text.strip().startswith("http"):
-                                # RSS 2.0 format: <link>https://...</link>
-                                link = link_elem.text.strip()
-                        if not link:
-                            logger.warning(f"Skipping article due to missing or invalid link in source '{name}'")
-                            continue
-                        entries[idx]['link'] = link
-                except Exception as e:
-                    logger.warning(f"Error fetching/parsing RSS feed for {name}: {e}")
-                    continue
-            # Process each entry (from either feedparser or manual parsing)
-            for entry in entries[: max_per_source * 2]:
-                # When using manual parsing, entry is a dict we created above
-                # otherwise it's a feedparser entry object.  Normalize fields.
-                if isinstance(entry, dict):
-                    title = entry.get('title', '')
-                    description = entry.get('description', '') or entry.get('summary', '')
-                    published_dt = entry.get('published_dt') or datetime.utcnow()
-                    link = entry.get('link', '') or ''
-                else:
-                    title = entry.get("title", "")
-                    description = entry.get("summary", "") or entry.get("description", "")
-                    published_raw = entry.get("published") or entry.get("updated")
-                    # Parse date using feedparser's structured tuple if available
-                    try:
-                        if hasattr(entry, "published_parsed") and entry.published_parsed:
-                            published_dt = datetime(*entry.published_parsed[:6])
-                        elif published_raw:
-                            published_dt = datetime.fromisoformat(published_raw)
-                        else:
-                            published_dt = datetime.utcnow()
-                    except Exception:
-                        published_dt = datetime.utcnow()
-                    link = entry.get("link", "") or ""
-                # Filter by topics if specified
-                text = f"{title} {description}".lower()
-                if topic_keywords and not any(kw in text for kw in topic_keywords):
-                    continue
-                # Skip articles older than seven days
-                if published_dt < datetime.utcnow() - timedelta(days=7):
-                    continue
-                articles.append({
-                    "title": title,
-                    "content": description,
-                    "url": link,
-                    "source": name,
-                    "published_at": published_dt.isoformat(),
-                    "metadata": {
-                        "rss": True,
-                    },
-                })
-
-        # Sort by published date descending
-        articles.sort(key=lambda x: x.get("published_at", ""), reverse=True)
-        # Return twice the requested count to allow for downstream ranking
-        return articles[: count * 2]
+            link = entry.get('link', '') or ''
+            # Filter by topics if specified
+            if topic_re and not (topic_re.search(title) or topic_re.search(description)):
+                continue
+            # Skip entries without a link and stories already taken
+            # from another feed
+            if not link:
+                continue
+            url_key = _canonical_url(link)
+            if url_key in seen_urls:
+                continue
+            seen_urls.add(url_key)
+            articles.append(Article(
+                title=title,
+                content=description,
+                url=link,
+                source=name,
+                published_at=published_dt.isoformat(),
+                published_ts=published_ts,
+                metadata={
+                    "rss": True,
+                },
+            ))
+            taken += 1
+            if taken >= limit:
+                break
     
     def _get_topic_category(self, topic: str) -> str:
         """
@@ -807,35 +1927,7 @@ class NewsAggregator:
         includes a wider set of synonyms for each.  If the topic matches
         multiple categories, the first match in the defined order is used.
         """
-        topic_lower = topic.lower().strip()
-        categories: dict[str, list[str]] = {
-            "business": [
-                "business", "finance", "economy", "economic", "stock", "stocks", "markets", "company", "companies"
-            ],
-            "entertainment": [
-                "entertainment", "movie", "movies", "film", "cinema", "hollywood", "music", "celebrity", "celebrities"
-            ],
-            "general": [
-                "general", "news", "top stories", "headlines", "current events"
-            ],
-            "health": [
-                "health", "healthcare", "medicine", "medical", "wellness", "fitness", "covid", "pandemic"
-            ],
-            "science": [
-                "science", "research", "physics", "chemistry", "biology", "space", "astronomy", "quantum"
-            ],
-            "sports": [
-                "sports", "sport", "football", "soccer", "basketball", "baseball", "tennis", "golf", "olympics"
-            ],
-            "technology": [
-                "technology", "tech", "gadget", "gadgets", "ai", "artificial intelligence", "machine learning", "computing", "software"
-            ],
-        }
-        for category, keywords in categories.items():
-            for keyword in keywords:
-                if re.search(rf"\b{re.escape(keyword)}\b", topic_lower):
-                    return category
-        return topic_lower
+        return _topic_category(topic.lower().strip())
         
 # Global aggregator instance
 news_aggregator = NewsAggregator()
\ No newline at end of file
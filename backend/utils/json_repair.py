@@ -22,7 +22,26 @@ package is present in the environment (as specified in
 fallback routines ensure graceful degradation.
 """
 
-from typing import Any
+import json as _json
+from typing import Any, List
+
+# orjson decodes several times faster than the standard library; fall back to
+# ``json`` when it is not installed.  Encoding stays with ``json.dumps``:
+# orjson's output differs from it (no spaces after separators, raw non-ASCII
+# characters, ``1e16`` rather than ``1e+16``, ``null`` for NaN), and ``dumps``
+# should not change format depending on what is installed.
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None  # type: ignore
+
+
+def _decode(text: str) -> Any:
+    """Decode a JSON string, using orjson when it is available."""
+    if _orjson is not None:
+        return _orjson.loads(text)
+    return _json.loads(text)
+
 
 try:
     # Prefer the robust external implementation if installed.  The
@@ -31,7 +50,6 @@ try:
     # input.  We alias them here for clarity.  Note: the package name
     # includes a hyphen on PyPI but the import is ``json_repair``.
     import json_repair as _jr  # type: ignore
-    import json as _json
 
     def jsonrepair(text: str) -> str:
         """Repair a JSON-like string using the external `json_repair` package.
@@ -52,6 +70,13 @@ try:
         :param text: Possibly malformed JSON string.
         :returns: Decoded Python object.
         """
+        # Most model output is already valid JSON; decode it directly and
+        # only pay for a repair pass when that fails.
+        if isinstance(text, str):
+            try:
+                return _decode(text)
+            except ValueError:
+                pass
         return _jr.loads(text)  # type: ignore[no-any-return]
 
     def dumps(obj: Any) -> str:
@@ -64,32 +89,72 @@ try:
 
 except ImportError:
     # Fallback minimal implementation when the external library is unavailable.
-    import re
-    import json as _json
 
     def jsonrepair(text: str) -> str:
         """Basic JSON repair fallback.
 
-        Performs simple fixes such as replacing single quotes with double quotes
-        and removing trailing commas before closing braces or brackets.
+        Performs simple fixes such as turning single-quoted strings into
+        double-quoted ones and removing trailing commas before closing
+        braces or brackets.  The text is scanned once, keeping track of
+        whether the current character is inside a string, so apostrophes
+        and commas within string values are left alone.
         """
         if not isinstance(text, str):
             return text  # type: ignore[return-value]
-        repaired = text
-        # Replace single quotes with double quotes
-        repaired = repaired.replace("'", '"')
-        # Remove trailing commas before closing braces/brackets
-        repaired = re.sub(r",\s*([}\]])", r"\1", repaired)
-        return repaired
+        out: List[str] = []
+        quote = ""  # Quote character of the string being scanned, if any
+        escaped = False
+        i, n = 0, len(text)
+        while i < n:
+            ch = text[i]
+            if quote:
+                if escaped:
+                    escaped = False
+                    # ``\'`` is not a valid JSON escape; the quote needs
+                    # none once the string is double-quoted.
+                    if ch == "'" and quote == "'":
+                        out[-1] = "'"
+                        i += 1
+                        continue
+                elif ch == "\\":
+                    escaped = True
+                elif ch == quote:
+                    quote = ""
+                    ch = '"'
+                elif ch == '"':
+                    # A double quote inside a single-quoted string
+                    ch = '\\"'
+            elif ch == '"' or ch == "'":
+                quote = ch
+                ch = '"'
+            elif ch == ",":
+                # Drop the comma if only whitespace separates it from a
+                # closing brace or bracket
+                j = i + 1
+                while j < n and text[j].isspace():
+                    j += 1
+                if j < n and text[j] in "}]":
+                    i += 1
+                    continue
+            out.append(ch)
+            i += 1
+        return "".join(out)
 
     def loads(text: str) -> Any:
         """Repair a JSON-like string and decode it to a Python object.
 
-        Strips extraneous characters outside the outermost braces, applies
-        minimal repairs and then delegates to ``json.loads``.
+        Input that is already valid JSON is decoded as is.  Otherwise strips
+        extraneous characters outside the outermost braces, applies
+        minimal repairs and then decodes the result with orjson (or
+        ``json.loads``).
         """
         if not isinstance(text, str):
             return text
+        # Valid JSON needs neither trimming nor repair.
+        try:
+            return _decode(text)
+        except ValueError:
+            pass
         raw = text.strip()
         # Find the bounds of the JSON object
         start = raw.find('{')
@@ -97,7 +162,7 @@ except ImportError:
         if start != -1 and end != -1 and start < end:
             raw = raw[start:end + 1]
         repaired = jsonrepair(raw)
-        return _json.loads(repaired)
+        return _decode(repaired)
 
     def dumps(obj: Any) -> str:
         """Serialize a Python object to a JSON string using the stdlib."""
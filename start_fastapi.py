@@ -4,27 +4,33 @@ Development startup script for the FastAPI backend
 """
 import os
 import sys
-import subprocess
 
-# Add backend directory to Python path
-backend_dir = os.path.join(os.path.dirname(__file__), 'backend')
-sys.path.insert(0, backend_dir)
+import uvicorn
+
+# Run from the repository root so the ``backend`` package (and its relative
+# imports) can be imported
+root_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, root_dir)
+
 
 def main():
-    os.chdir(backend_dir)
-    
+    os.chdir(root_dir)
+
     # Set development environment
     os.environ['ENVIRONMENT'] = 'development'
     os.environ['PORT'] = '8000'
-    
-    # Start FastAPI with hot reload
-    subprocess.run([
-        'uvicorn', 
-        'main:app', 
-        '--host', '0.0.0.0',
-        '--port', '8000',
-        '--reload'
-    ])
+
+    # Start FastAPI with hot reload.  uvicorn runs in this process and its
+    # reloader manages the worker process itself, instead of us spawning
+    # the ``uvicorn`` CLI as a child process.
+    uvicorn.run(
+        'backend.main:app',
+        host='0.0.0.0',
+        port=8000,
+        reload=True,
+        reload_dirs=[os.path.join(root_dir, 'backend')],
+    )
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()